@@ -21,6 +21,7 @@ import importDXF
 import importSVG
 import Part
 import requests
+import TechDraw
 from FreeCAD import Rotation, Vector  # NoQa
 from PySide import QtGui
 
@@ -42,6 +43,21 @@ REAR = "BACK"
 
 MAX_SLEEP_DURATION = 5
 
+ALL_VIEWS = [TOP, BOTTOM, FRONT, BACK, LEFT, RIGHT, "ALL"]
+VIEW_FORMATS = ("PNG", "DXF", "SVG")
+# Orientation of each view as (direction, x_axis). The direction points from the part towards the viewer and the
+# x_axis is the direction that is to the right in the drawing, these match the FreeCAD standard views.
+# ALL is the isometric view, the batched renderer uses viewIsometric() so the PNG matches the 2D outputs.
+VIEW_ORIENTATIONS = {
+    TOP: ((0, 0, 1), (1, 0, 0)),
+    BOTTOM: ((0, 0, -1), (1, 0, 0)),
+    FRONT: ((0, -1, 0), (1, 0, 0)),
+    BACK: ((0, 1, 0), (-1, 0, 0)),
+    LEFT: ((-1, 0, 0), (0, -1, 0)),
+    RIGHT: ((1, 0, 0), (0, 1, 0)),
+    "ALL": ((1, -1, 1), (1, 1, 0)),
+}
+
 
 class EngineFreecad:
     """This class will be used in FreeCAD to decode a JSON passed to it.
@@ -310,6 +326,152 @@ class EngineFreecad:
         importSVG.export(__objs__, str(target_image_file))
         return target_image_file
 
+    def _parse_views(self, views: list[str] | str | None) -> list[str]:
+        """Normalise and check a list of views.
+
+        Args:
+            views: A list of sides or a comma separated string of sides, defaults to all the views.
+
+        Returns:
+            The upper case sides without duplicates, with REAR mapped to BACK.
+        """
+        if views is None:
+            return list(ALL_VIEWS)
+        if isinstance(views, str):
+            views = views.split(",")
+        sides = []
+        for view in views:
+            side = str(view).upper().strip()
+            if side == "REAR":
+                side = BACK
+            if side not in VIEW_ORIENTATIONS:
+                msg = f"side: {view} is not one of TOP, BOTTOM, LEFT, RIGHT, FRONT, BACK, OR ALL."
+                raise ValueError(msg)
+            if side not in sides:
+                sides.append(side)
+        if not sides:
+            msg = "At least one view is required."
+            raise ValueError(msg)
+        return sides
+
+    def _view_axes(self, side: str) -> tuple[tuple[float, float, float], ...]:
+        """Calculate the unit x, y and direction axes of a view.
+
+        Args:
+            side: The side the view is from.
+
+        Returns:
+            The x axis (right), y axis (up) and direction (towards the viewer) of the view.
+        """
+
+        def normalise(vector):
+            length = sqrt(sum(value * value for value in vector))
+            return tuple(value / length for value in vector)
+
+        direction, x_axis = (normalise(vector) for vector in VIEW_ORIENTATIONS[side])
+        y_axis = (
+            direction[1] * x_axis[2] - direction[2] * x_axis[1],
+            direction[2] * x_axis[0] - direction[0] * x_axis[2],
+            direction[0] * x_axis[1] - direction[1] * x_axis[0],
+        )
+        return x_axis, y_axis, direction
+
+    def _project(self, shape: Part.Shape, side: str) -> Part.Shape:
+        """Project the shape onto the plane facing the given side and return the visible edges.
+
+        The shape is rotated so the view lines up with the XY plane before it is projected along Z,
+        this keeps each drawing in the same orientation as the PNG of that side.
+        Smooth edges, where a rounded face meets a flat face, are left out since they are not cut lines.
+
+        Args:
+            shape: The shape to project.
+            side: The side the projection is viewed from.
+        """
+        x_axis, y_axis, direction = self._view_axes(side)
+        # The rows of the matrix are the view axes, it maps the view x, y and direction onto X, Y and Z.
+        matrix = App.Matrix(*x_axis, 0, *y_axis, 0, *direction, 0, 0, 0, 0, 1)
+        aligned = shape.copy()
+        aligned.transformShape(matrix)
+        visible, _visible_smooth, _visible_sewn, visible_outline, *_hidden = TechDraw.projectEx(
+            aligned, Vector(0, 0, 1)
+        )
+        edges = []
+        for compound in (visible, visible_outline):
+            if not compound.isNull():
+                edges.extend(compound.Edges)
+        return Part.makeCompound(edges)
+
+    def _set_view(self, view_doc: FreeCADGui.activeDocument, side: str):
+        """Point the camera at the side, ALL uses the isometric view to match VIEW_ORIENTATIONS.
+
+        Args:
+            view_doc: Freecad active doc.
+            side: The side the view is from.
+        """
+        if side == "ALL":
+            view_doc.activeView().viewIsometric()
+        else:
+            self.change_view(active_doc=view_doc, side=side)
+
+    def render_views(
+        self,
+        path: Path,
+        active_doc: App.Document,
+        views: list[str] | str | None = None,
+        formats: list[str] | None = None,
+    ) -> list[Path]:
+        """Render several views of the object in one pass.
+
+        The camera is fitted once and only its orientation changes between views.
+        The shape is projected once per side and the projection is shared by the DXF and SVG outputs.
+
+        Args:
+            path: The directory where the output files are stored.
+            active_doc: The FreeCAD document.
+            views: The sides to produce output files for, as a list or comma separated string.
+                Defaults to all six sides and the isometric view.
+            formats: The output formats, any of PNG, DXF and SVG.
+        """
+        views = self._parse_views(views)
+        if formats is None:
+            formats = list(VIEW_FORMATS)
+        formats = [out_format.upper().strip() for out_format in formats]
+        for out_format in formats:
+            if out_format not in VIEW_FORMATS:
+                msg = f"file_type: {out_format} is not one of PNG, DXF or SVG."
+                raise ValueError(msg)
+
+        view_doc = FreeCADGui.activeDocument()
+        shape = active_doc.getObject("Shape").Shape
+        # Only the camera orientation changes per view, the displayed tessellation is reused for every PNG.
+        self._set_view(view_doc, views[0])
+        FreeCADGui.SendMsgToActiveView("ViewFit")
+        view_doc.activeView().fitAll()
+
+        file_list = []
+        for side in views:
+            self._set_view(view_doc, side)
+            if "PNG" in formats:
+                target_image_file = path / f"{PART_NO_TEMPLATE}-{side}.png"
+                view_doc.activeView().saveImage(str(target_image_file), 2000, 1800, "White")
+                file_list.append(target_image_file)
+            if "DXF" in formats or "SVG" in formats:
+                projection = active_doc.addObject("Part::Feature", f"Projection{side}")
+                try:
+                    projection.Shape = self._project(shape, side)
+                    projection.ViewObject.Visibility = False
+                    if "DXF" in formats:
+                        target_image_file = path / f"{PART_NO_TEMPLATE}-{side}.dxf"
+                        importDXF.export([projection], str(target_image_file))
+                        file_list.append(target_image_file)
+                    if "SVG" in formats:
+                        target_image_file = path / f"{PART_NO_TEMPLATE}-{side}.svg"
+                        importSVG.export([projection], str(target_image_file))
+                        file_list.append(target_image_file)
+                finally:
+                    active_doc.removeObject(projection.Name)
+        return file_list
+
     def render_to_stl(self, path: Path, active_doc: App.Document):
         """This method will be used for creating a STL of an object currently in view.
         Args:
@@ -504,13 +666,21 @@ class EngineFreecad:
 
         if App.ActiveDocument:
             App.closeDocument(name)
+        outformats = ["PNG", "STL", "DXF"]
+        views = definition.get("views")
+        if views is not None:
+            # Check the views before anything is built, a bad job spec should not leave partial output.
+            views = self._parse_views(views)
         doc = App.newDocument(name)
         file_list = []
         file_list.append(self.construct_from_features(doc, definition["features"], part_path))
-        outformats = "PNG,STL,DXF"
-        for out_choice in outformats.upper().split(","):
-            ftype = out_choice
-            out_format = ftype.strip()
+        view_formats = [out_format for out_format in outformats if out_format in VIEW_FORMATS]
+        if views:
+            # Render all the requested views of the 2D and image formats in a single pass.
+            file_list.extend(self.render_views(part_path, active_doc=doc, views=views, formats=view_formats))
+        for out_format in outformats:
+            if views and out_format in view_formats:
+                continue
             match out_format:
                 case "PNG":
                     file_list.append(self.render_to_png(part_path, view="ALL"))
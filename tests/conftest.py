@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2025 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib
+import importlib.util
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+import cycax_freecad_worker
+
+FREECAD_MODULES = ("FreeCAD", "FreeCADGui", "importDXF", "importSVG", "Part", "TechDraw", "PySide")
+
+
+@pytest.fixture
+def freecad_client(monkeypatch):
+    """Import the FreeCAD client with the FreeCAD modules stubbed, they are only available inside FreeCAD.
+
+    The stubs and the imported module are removed again when the test is done.
+    """
+    for module_name in FREECAD_MODULES:
+        monkeypatch.setitem(sys.modules, module_name, MagicMock())
+    if importlib.util.find_spec("requests") is None:
+        monkeypatch.setitem(sys.modules, "requests", MagicMock())
+    monkeypatch.delitem(sys.modules, "cycax_freecad_worker.cycax_client_freecad", raising=False)
+    monkeypatch.delattr(cycax_freecad_worker, "cycax_client_freecad", raising=False)
+    return importlib.import_module("cycax_freecad_worker.cycax_client_freecad")
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2025 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+import pytest
+
+
+def projection(*edges):
+    """A stub of the TechDraw.projectEx result with the given visible edges."""
+    compounds = [MagicMock() for _ in range(10)]
+    for compound in compounds:
+        compound.isNull.return_value = True
+    compounds[0].isNull.return_value = False
+    compounds[0].Edges = list(edges)
+    return compounds
+
+
+@pytest.fixture
+def engine(freecad_client, monkeypatch, tmp_path: Path):
+    engine = freecad_client.EngineFreecad()
+    monkeypatch.setattr(engine, "construct_from_features", MagicMock(return_value=tmp_path / "part.FCStd"))
+    monkeypatch.setattr(engine, "render_to_png", MagicMock(return_value=tmp_path / "legacy.png"))
+    monkeypatch.setattr(engine, "render_to_dxf", MagicMock(return_value=tmp_path / "legacy.dxf"))
+    monkeypatch.setattr(engine, "render_to_svg", MagicMock(return_value=tmp_path / "legacy.svg"))
+    monkeypatch.setattr(engine, "render_to_stl", MagicMock(return_value=tmp_path / "legacy.stl"))
+    freecad_client.TechDraw.projectEx.return_value = projection("edge")
+    return engine
+
+
+def test_parse_views(freecad_client):
+    engine = freecad_client.EngineFreecad()
+    assert engine._parse_views(None) == freecad_client.ALL_VIEWS
+    assert engine._parse_views("top, Front,rear") == ["TOP", "FRONT", "BACK"]
+    assert engine._parse_views(["all", "LEFT"]) == ["ALL", "LEFT"]
+    assert engine._parse_views("TOP,top,BACK,REAR,FRONT") == ["TOP", "BACK", "FRONT"]
+
+
+@pytest.mark.parametrize("views", [[], "TOP,SIDEWAYS", ["TOP", "T"], ""])
+def test_parse_views_invalid(freecad_client, views):
+    with pytest.raises(ValueError):
+        freecad_client.EngineFreecad()._parse_views(views)
+
+
+@pytest.mark.parametrize(
+    ("side", "x_axis", "y_axis"),
+    [
+        ("TOP", (1, 0, 0), (0, 1, 0)),
+        ("BOTTOM", (1, 0, 0), (0, -1, 0)),
+        ("FRONT", (1, 0, 0), (0, 0, 1)),
+        ("BACK", (-1, 0, 0), (0, 0, 1)),
+        ("LEFT", (0, -1, 0), (0, 0, 1)),
+        ("RIGHT", (0, 1, 0), (0, 0, 1)),
+    ],
+)
+def test_view_axes(freecad_client, side, x_axis, y_axis):
+    """The drawing of each side has the same right and up directions as the FreeCAD standard view."""
+    engine = freecad_client.EngineFreecad()
+    assert engine._view_axes(side) == (x_axis, y_axis, freecad_client.VIEW_ORIENTATIONS[side][0])
+
+
+def test_view_axes_isometric(freecad_client):
+    x_axis, y_axis, direction = freecad_client.EngineFreecad()._view_axes("ALL")
+    assert x_axis == pytest.approx((2**-0.5, 2**-0.5, 0))
+    assert y_axis == pytest.approx((-(6**-0.5), 6**-0.5, 2 * 6**-0.5))
+    assert direction == pytest.approx((3**-0.5, -(3**-0.5), 3**-0.5))
+
+
+@pytest.mark.parametrize(
+    ("side", "rows"),
+    [
+        ("FRONT", (1, 0, 0, 0, 0, 0, 1, 0, 0, -1, 0, 0)),
+        ("LEFT", (0, -1, 0, 0, 0, 0, 1, 0, -1, 0, 0, 0)),
+    ],
+)
+def test_project_orientation(freecad_client, side, rows):
+    """The shape is rotated so the view lines up with the XY plane and then projected along Z."""
+    freecad_client.TechDraw.projectEx.return_value = projection("edge")
+    shape = MagicMock()
+    freecad_client.EngineFreecad()._project(shape, side)
+    freecad_client.App.Matrix.assert_called_once_with(*rows, 0, 0, 0, 1)
+    shape.copy.return_value.transformShape.assert_called_once_with(freecad_client.App.Matrix.return_value)
+    freecad_client.Vector.assert_called_once_with(0, 0, 1)
+    freecad_client.TechDraw.projectEx.assert_called_once_with(
+        shape.copy.return_value, freecad_client.Vector.return_value
+    )
+
+
+def test_project_skips_smooth_edges(freecad_client):
+    visible, smooth, sewn, outline = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    visible.isNull.return_value = False
+    outline.isNull.return_value = False
+    visible.Edges = ["visible"]
+    smooth.Edges = ["smooth"]
+    outline.Edges = ["outline"]
+    freecad_client.TechDraw.projectEx.return_value = [visible, smooth, sewn, outline]
+    freecad_client.EngineFreecad()._project(MagicMock(), "TOP")
+    freecad_client.Part.makeCompound.assert_called_once_with(["visible", "outline"])
+
+
+def test_render_views(freecad_client, tmp_path: Path):
+    freecad_client.TechDraw.projectEx.return_value = projection("edge")
+    active_doc = MagicMock()
+    file_list = freecad_client.EngineFreecad().render_views(
+        tmp_path, active_doc, views="TOP,rear", formats=["png", "DXF"]
+    )
+    template = freecad_client.PART_NO_TEMPLATE
+    assert [filepath.name for filepath in file_list] == [
+        f"{template}-TOP.png",
+        f"{template}-TOP.dxf",
+        f"{template}-BACK.png",
+        f"{template}-BACK.dxf",
+    ]
+    assert active_doc.removeObject.call_count == 2
+
+
+def test_render_views_fits_and_projects_once(freecad_client, tmp_path: Path):
+    """The camera is fitted once for all the views and DXF and SVG share one projection per side."""
+    freecad_client.TechDraw.projectEx.return_value = projection("edge")
+    gui = freecad_client.FreeCADGui
+    active_view = gui.activeDocument.return_value.activeView.return_value
+    file_list = freecad_client.EngineFreecad().render_views(tmp_path, MagicMock())
+    assert len(file_list) == 3 * len(freecad_client.ALL_VIEWS)
+    gui.SendMsgToActiveView.assert_called_once_with("ViewFit")
+    active_view.fitAll.assert_called_once_with()
+    assert freecad_client.TechDraw.projectEx.call_count == len(freecad_client.ALL_VIEWS)
+    assert freecad_client.importDXF.export.call_count == len(freecad_client.ALL_VIEWS)
+    assert freecad_client.importSVG.export.call_count == len(freecad_client.ALL_VIEWS)
+
+
+def test_render_views_isometric(freecad_client, tmp_path: Path):
+    """ALL uses the isometric view, not the axonometric preference, so the PNG matches the drawings."""
+    freecad_client.TechDraw.projectEx.return_value = projection("edge")
+    active_view = freecad_client.FreeCADGui.activeDocument.return_value.activeView.return_value
+    freecad_client.EngineFreecad().render_views(tmp_path, MagicMock(), views=["ALL"], formats=["PNG"])
+    assert active_view.viewIsometric.call_args_list == [call(), call()]
+    active_view.viewAxometric.assert_not_called()
+
+
+def test_render_views_invalid_before_output(freecad_client, tmp_path: Path):
+    engine = freecad_client.EngineFreecad()
+    active_doc = MagicMock()
+    with pytest.raises(ValueError):
+        engine.render_views(tmp_path, active_doc, views=["TOP", "SIDEWAYS"])
+    with pytest.raises(ValueError):
+        engine.render_views(tmp_path, active_doc, views=["TOP"], formats=["STL"])
+    freecad_client.FreeCADGui.activeDocument.assert_not_called()
+    active_doc.addObject.assert_not_called()
+
+
+def test_render_views_removes_projection_on_error(freecad_client, tmp_path: Path):
+    freecad_client.TechDraw.projectEx.return_value = projection("edge")
+    freecad_client.importDXF.export.side_effect = RuntimeError("export")
+    active_doc = MagicMock()
+    with pytest.raises(RuntimeError):
+        freecad_client.EngineFreecad().render_views(tmp_path, active_doc, views=["TOP"], formats=["DXF"])
+    active_doc.removeObject.assert_called_once()
+
+
+def test_build_without_views(engine, tmp_path: Path):
+    file_list = engine.build(tmp_path, {"features": []}, job_id="1")
+    assert [filepath.name for filepath in file_list] == ["part.FCStd", "legacy.png", "legacy.stl", "legacy.dxf"]
+
+
+def test_build_with_views(freecad_client, engine, tmp_path: Path):
+    file_list = engine.build(tmp_path, {"features": [], "views": "TOP,FRONT,top"}, job_id="1")
+    template = freecad_client.PART_NO_TEMPLATE
+    assert [filepath.name for filepath in file_list] == [
+        "part.FCStd",
+        f"{template}-TOP.png",
+        f"{template}-TOP.dxf",
+        f"{template}-FRONT.png",
+        f"{template}-FRONT.dxf",
+        "legacy.stl",
+    ]
+    engine.render_to_png.assert_not_called()
+    engine.render_to_dxf.assert_not_called()
+    engine.render_to_stl.assert_called_once()
+
+
+def test_build_invalid_views(engine, tmp_path: Path):
+    with pytest.raises(ValueError):
+        engine.build(tmp_path, {"features": [], "views": ["TOP", "T"]}, job_id="1")
+    engine.construct_from_features.assert_not_called()